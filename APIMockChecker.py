@@ -1,163 +1,316 @@
-import json
+import copy
 import traceback
-from jsonschema import validate
-from faker import Faker
-import random
 import sys
 import logging
 import re
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import urlsplit, parse_qs
 import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from json_compat import json_loads, json_dumps
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
 
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=os.environ.get("LOG_LEVEL", "INFO").upper(),
     format="%(asctime)s - %(levelname)s - %(message)s",
     handlers=[logging.FileHandler("debug.log"), logging.StreamHandler(sys.stdout)],
 )
 logger = logging.getLogger(__name__)
 
-fake = Faker()
+if fastjsonschema is None:
+    logger.warning("fastjsonschema is not installed; mock responses will not be validated.")
+
+def _load_json_file(file_path):
+    with open(file_path, 'rb') as file:
+        raw = file.read()
+    try:
+        return json_loads(raw)
+    except ValueError:
+        # Only retry when the bytes are not UTF-8; real syntax errors propagate.
+        try:
+            raw.decode('utf-8')
+        except UnicodeDecodeError:
+            pass
+        else:
+            raise
+    logger.warning(f"Unable to read {file_path} with UTF-8 encoding. Trying with ISO-8859-1.")
+    return json_loads(raw.decode('iso-8859-1'))
+
+MOCK_STRING = "string"
+MOCK_DATE = "2024-01-01"
+MOCK_DATE_TIME = "2024-01-01T00:00:00Z"
+
+
+def _mock_object(schema, depth, stack):
+    response = {}
+    for prop, prop_schema in schema.get("properties", {}).items():
+        response[prop] = None
+        stack.append((response, prop, prop_schema, depth + 1))
+    return response
+
+def _mock_array(schema, depth, stack):
+    response = [None]
+    stack.append((response, 0, schema.get("items", {}), depth + 1))
+    return response
+
+def _mock_string(schema, depth, stack):
+    if "enum" in schema:
+        return schema["enum"][0]
+    elif "format" in schema:
+        if schema["format"] == "date-time":
+            return MOCK_DATE_TIME
+        elif schema["format"] == "date":
+            return MOCK_DATE
+    return MOCK_STRING
+
+MOCK_HANDLERS = {
+    "object": _mock_object,
+    "array": _mock_array,
+    "string": _mock_string,
+    "number": lambda schema, depth, stack: 0.0,
+    "integer": lambda schema, depth, stack: 0,
+    "boolean": lambda schema, depth, stack: True,
+}
+
+def _unsigned(value):
+    return value[1:] if value.startswith('-') else value
+
+def _is_string(value):
+    return isinstance(value, str)
+
+def _is_integer(value):
+    if isinstance(value, str):
+        return _unsigned(value).isdigit()
+    return isinstance(value, int)
+
+def _is_number(value):
+    if isinstance(value, str):
+        return _unsigned(value).replace('.', '').isdigit()
+    return isinstance(value, (int, float))
+
+def _is_boolean(value):
+    if isinstance(value, str):
+        return value.lower() in ('true', 'false')
+    return isinstance(value, bool)
+
+TYPE_CHECKS = {
+    "string": _is_string,
+    "integer": _is_integer,
+    "number": _is_number,
+    "boolean": _is_boolean,
+}
 
 class BankAPIMockChecker:
     def __init__(self, openapi_spec_path):
-        with open(openapi_spec_path, "r") as f:
-            self.openapi_spec = json.load(f)
+        self.openapi_spec = _load_json_file(openapi_spec_path)
         self.max_recursion_depth = 10
+        self._ref_cache = {}
+        self._compiled_patterns = {}
+        self._base_paths = self._get_base_paths()
+        self._resolved_spec = self._materialize_refs(self.openapi_spec)
+        self._endpoint_index = {}
+        for path in self._resolved_spec.get("paths", {}):
+            self._endpoint_index.setdefault(self._normalize_endpoint(path), path)
+        self._param_index = self._build_param_index()
+        self._mock_responses = {}
 
     def mock_execute_request(self, api_name, url, method, endpoint, params=None):
-        logger.debug(f"Starting mock_execute_request for {method} {endpoint}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Starting mock_execute_request for {method} {endpoint}")
         try:
-            if not self._validate_url(url):
+            parsed_url = urlsplit(url)
+            if not self._validate_url(parsed_url):
                 raise ValueError(f"Invalid URL: {url}")
 
-            parsed_url = urlparse(url)
             query_params = parse_qs(parsed_url.query)
 
-            path_params = self._extract_path_params(endpoint)
-            
-            formatted_endpoint = self._format_endpoint(endpoint)
-
-            if formatted_endpoint not in self.openapi_spec["paths"]:
-                raise ValueError(f"Endpoint {formatted_endpoint} not found in OpenAPI spec")
-
-            if method.lower() not in self.openapi_spec["paths"][formatted_endpoint]:
-                raise ValueError(f"Method {method} not found for endpoint {formatted_endpoint}")
-
-            if not url.startswith(
-                f"{parsed_url.scheme}://{parsed_url.netloc}{self._get_base_url()}"
-            ):
-                raise ValueError(
-                    f"URL does not match the base URL defined in the OpenAPI spec: {url}"
-                )
-
-            endpoint_spec = self.openapi_spec["paths"][formatted_endpoint][method.lower()]
+            if endpoint in self._resolved_spec.get("paths", {}):
+                spec_endpoint = endpoint
+            else:
+                spec_endpoint = self._endpoint_index.get(self._normalize_endpoint(endpoint))
+            if spec_endpoint is None:
+                raise ValueError(f"Endpoint {endpoint} not found in OpenAPI spec")
 
-            self._validate_params(params, query_params, path_params, endpoint_spec.get("parameters", []))
+            if method.lower() not in self._resolved_spec["paths"][spec_endpoint]:
+                raise ValueError(f"Method {method} not found for endpoint {spec_endpoint}")
 
-            response_spec = endpoint_spec["responses"]
-            success_code = next(
-                (code for code in response_spec.keys() if code.startswith("2")), "200"
-            )
+            operation_key = (spec_endpoint, method.lower())
 
-            if success_code == "204":
-                mock_response = None
-            elif "content" in response_spec[success_code]:
-                response_schema = response_spec[success_code]["content"]["application/json"]["schema"]
-                mock_response = self._generate_mock_response(response_schema)
-            else:
-                mock_response = {}
+            self._validate_params(params, query_params, self._param_index[operation_key])
 
-            if mock_response is not None:
-                try:
-                    response_schema = response_spec[success_code].get("content", {}).get("application/json", {}).get("schema", {})
-                    validate(instance=mock_response, schema=response_schema)
-                    logger.info("Mock response successfully validated against the schema.")
-                except Exception as e:
-                    logger.error(f"Schema validation error: {e}")
+            if operation_key not in self._mock_responses:
+                self._mock_responses[operation_key] = self._build_mock_response(operation_key)
+            success_code, mock_template = self._mock_responses[operation_key]
+            mock_response = copy.deepcopy(mock_template)
 
-            logger.info(f"Mock execution completed with status code: {success_code}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Mock execution completed with status code: {success_code}")
             return {"status_code": int(success_code), "data": mock_response}
         
         except ValueError as ve:
             logger.error(f"Validation error: {str(ve)}")
             return {"status_code": 400, "data": {"error": str(ve)}}
         except Exception as e:
-            logger.error(f"Error in mock_execute_request: {str(e)}")
-            logger.error(traceback.format_exc()) 
+            logger.error(f"Error in mock_execute_request: {e!r}")
+            logger.debug("mock_execute_request traceback", exc_info=True)
             return {"status_code": 500, "data": {"error": "Internal server error"}}
 
-    def _validate_url(self, url):
-        parsed_url = urlparse(url)
-        base_url = self._get_base_url()
-        return base_url is None or parsed_url.path.startswith(base_url)
+    def _build_mock_response(self, operation_key):
+        # Mock values are deterministic, so each operation's response is
+        # generated and validated once and then copied for every request.
+        endpoint, method = operation_key
+        response_spec = self._resolved_spec["paths"][endpoint][method]["responses"]
+        success_code = next(
+            (code for code in response_spec.keys() if code.startswith("2")), "200"
+        )
+
+        if success_code == "204":
+            mock_response = None
+        elif "content" in response_spec[success_code]:
+            response_schema = response_spec[success_code]["content"]["application/json"]["schema"]
+            mock_response = self._generate_mock_response(response_schema)
+        else:
+            mock_response = {}
 
-    def _get_base_url(self):
-        if "servers" in self.openapi_spec:
-            return urlparse(self.openapi_spec["servers"][0]["url"]).path
+        validator = None
+        if mock_response is not None:
+            validator = self._compile_validator(operation_key, success_code)
+        if validator is not None:
+            try:
+                validator(mock_response)
+                logger.debug("Mock response successfully validated against the schema.")
+            except Exception as e:
+                logger.error(f"Schema validation error: {e}")
+
+        return success_code, mock_response
+
+    def _compile_validator(self, operation_key, success_code):
+        # The schema is taken from the raw spec together with its
+        # components/definitions so fastjsonschema resolves $refs itself,
+        # including cyclic ones.
+        if fastjsonschema is None:
+            return None
+        endpoint, method = operation_key
+        responses = self.openapi_spec["paths"][endpoint][method]["responses"]
+        response = self._resolve_ref(responses.get(success_code, {}))
+        schema = response.get("content", {}).get("application/json", {}).get("schema")
+        if schema is None:
+            return None
+        document = {"$ref": "#/schema", "schema": schema}
+        for key in ("components", "definitions"):
+            if key in self.openapi_spec:
+                document[key] = self.openapi_spec[key]
+        try:
+            return fastjsonschema.compile(document, use_default=False, use_formats=False)
+        except Exception as e:
+            logger.warning(f"Unable to compile response schema for {method.upper()} {endpoint}: {e}")
+            return None
+
+    def _validate_url(self, parsed_url):
+        return self._base_paths is None or parsed_url.path.startswith(self._base_paths)
+
+    def _get_base_paths(self):
+        base_paths = tuple(
+            urlsplit(server["url"]).path
+            for server in self.openapi_spec.get("servers", [])
+            if "url" in server
+        )
+        if base_paths:
+            return base_paths
         elif "basePath" in self.openapi_spec:
-            return self.openapi_spec["basePath"]
+            return (self.openapi_spec["basePath"],)
         else:
             logger.warning("No 'servers' or 'basePath' found in OpenAPI spec. URL validation will be skipped.")
             return None
 
     def _extract_path_params(self, endpoint):
-        return re.findall(r'\{([^}]+)\}', endpoint)
-
-    def _format_endpoint(self, endpoint):
-        parts = endpoint.split('/')
-        formatted_parts = []
-        for part in parts:
-            if part.startswith('{') and part.endswith('}'):
-                formatted_parts.append(part)
-            elif '{' in part and '}' in part:
-                formatted_parts.append(part)
-            elif '_' in part:
-                formatted_parts.append(part)
-            else:
-                matched = False
-                for spec_endpoint in self.openapi_spec["paths"].keys():
-                    if part in spec_endpoint.split('/'):
-                        formatted_parts.append(part)
-                        matched = True
-                        break
-                if not matched:
-                    formatted_parts.append(part)  
-        return '/'.join(formatted_parts)
-
-    def _validate_params(self, params, query_params, path_params, param_specs):
-        resolved_param_specs = self._resolve_param_specs(param_specs)
-        
-        all_params = {**params} if params else {}
-        all_params.update({k: v[0] if isinstance(v, list) else v for k, v in query_params.items()})
+        path_params = []
+        start = endpoint.find('{')
+        while start != -1:
+            end = endpoint.find('}', start + 1)
+            if end == -1:
+                break
+            if end > start + 1:
+                path_params.append(endpoint[start + 1:end])
+            start = endpoint.find('{', end + 1)
+        return path_params
+
+    def _normalize_endpoint(self, endpoint):
+        # Collapse every {param} placeholder to "*" so templated paths match
+        # regardless of how the placeholders are named.
+        parts = []
+        last = 0
+        start = endpoint.find('{')
+        while start != -1:
+            end = endpoint.find('}', start + 1)
+            if end == -1:
+                break
+            parts.append(endpoint[last:start])
+            parts.append('*')
+            last = end + 1
+            start = endpoint.find('{', last)
+        parts.append(endpoint[last:])
+        return ''.join(parts)
+
+    def _build_param_index(self):
+        param_index = {}
+        for endpoint, path_item in self._resolved_spec.get("paths", {}).items():
+            path_params = self._extract_path_params(endpoint)
+            for method, operation in path_item.items():
+                if not isinstance(operation, dict):
+                    continue
+                by_name = {}
+                required = []
+                for param_spec in self._resolve_param_specs(operation.get("parameters", [])):
+                    if "name" not in param_spec:
+                        logger.warning(f"Parameter specification missing 'name': {param_spec}")
+                        continue
+                    param_name = param_spec["name"]
+                    by_name[param_name] = self._resolve_ref(param_spec.get("schema", {}))
+                    if param_spec.get("required", False) and param_name not in path_params:
+                        required.append(param_name)
+                param_index[(endpoint, method)] = {
+                    "expected": frozenset(by_name).union(path_params),
+                    "by_name": by_name,
+                    "required": required,
+                    "path_params": path_params,
+                }
+        return param_index
+
+    def _validate_params(self, params, query_params, param_index):
+        all_params = dict(params) if params else {}
+        # parse_qs always returns a list of values per key
+        for k, v in query_params.items():
+            all_params[k] = v[0]
         
-        for path_param in path_params:
+        for path_param in param_index["path_params"]:
             if path_param not in all_params:
                 raise ValueError(f"Missing path parameter: {path_param}")
 
-        expected_params = set(spec.get("name") for spec in resolved_param_specs if "name" in spec)
-        expected_params.update(set(path_params))
-        unexpected_params = set(all_params.keys()) - expected_params
+        unexpected_params = all_params.keys() - param_index["expected"]
         if unexpected_params:
             raise ValueError(f"Unexpected parameter(s): {', '.join(unexpected_params)}")
 
-        for param_spec in resolved_param_specs:
-            if "name" not in param_spec:
-                logger.warning(f"Parameter specification missing 'name': {param_spec}")
+        by_name = param_index["by_name"]
+        for param_name, param_value in all_params.items():
+            schema = by_name.get(param_name)
+            if schema is None:
                 continue
-
-            param_name = param_spec["name"]
-            if param_name in all_params:
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug(f"Validating parameter: {param_name}")
-                param_value = all_params[param_name]
-                schema = self._resolve_ref(param_spec.get("schema", {}))
 
-                self._validate_param_type(param_name, param_value, schema.get("type"))
+            self._validate_param_type(param_name, param_value, schema.get("type"))
 
-                self._validate_enum(param_name, param_value, schema.get("enum"))
+            self._validate_enum(param_name, param_value, schema.get("enum"))
 
-                self._validate_pattern(param_name, param_value, schema.get("pattern"))
+            self._validate_pattern(param_name, param_value, schema.get("pattern"))
 
-            elif param_spec.get("required", False) and param_name not in path_params:
+        for param_name in param_index["required"]:
+            if param_name not in all_params:
                 raise ValueError(f"Missing required parameter: {param_name}")
 
     def _resolve_param_specs(self, param_specs):
@@ -172,24 +325,67 @@ class BankAPIMockChecker:
 
     def _resolve_ref(self, schema):
         if "$ref" in schema:
-            ref_path = schema["$ref"].split("/")[1:]
-            resolved_schema = self.openapi_spec
-            for path in ref_path:
-                resolved_schema = resolved_schema.get(path)
+            ref = schema["$ref"]
+            if ref not in self._ref_cache:
+                resolved_schema = self._lookup_ref(ref)
                 if resolved_schema is None:
-                    logger.error(f"Failed to resolve $ref: {schema['$ref']}")
+                    logger.error(f"Failed to resolve $ref: {ref}")
                     return schema
-            return resolved_schema
+                self._ref_cache[ref] = resolved_schema
+            return self._ref_cache[ref]
         return schema
 
+    def _lookup_ref(self, ref):
+        resolved_schema = self.openapi_spec
+        for path in ref.split("/")[1:]:
+            if not isinstance(resolved_schema, dict):
+                return None
+            resolved_schema = resolved_schema.get(path)
+            if resolved_schema is None:
+                return None
+        return resolved_schema
+
+    def _materialize_refs(self, node):
+        # Inline local $refs once so request handling never walks them again.
+        # Like _generate_mock_response this uses an explicit stack, so deeply
+        # nested specs stay within the low recursion limit set in __main__.
+        # Cyclic refs and refs nested deeper than max_recursion_depth are left
+        # in place and resolved lazily by _resolve_ref. A ref's container is
+        # cached as soon as it is created; entries are popped depth-first, so
+        # only refs already on the current path (in seen) can be unfinished.
+        root = [None]
+        stack = [(root, 0, node, 0, frozenset(), ())]
+        while stack:
+            parent, key, node, depth, seen, refs = stack.pop()
+            value = node
+            if isinstance(node, dict):
+                ref = node.get("$ref")
+                if isinstance(ref, str) and ref.startswith("#/"):
+                    if ref not in seen and depth < self.max_recursion_depth:
+                        if ref in self._ref_cache:
+                            value = self._ref_cache[ref]
+                        else:
+                            target = self._lookup_ref(ref)
+                            if target is not None:
+                                stack.append((parent, key, target, depth + 1, seen | {ref}, refs + (ref,)))
+                                continue
+                else:
+                    value = {}
+                    for child_key, child in node.items():
+                        value[child_key] = None
+                        stack.append((value, child_key, child, depth, seen, ()))
+            elif isinstance(node, list):
+                value = [None] * len(node)
+                for index, item in enumerate(node):
+                    stack.append((value, index, item, depth, seen, ()))
+            parent[key] = value
+            for ref in refs:
+                self._ref_cache[ref] = value
+        return root[0]
+
     def _validate_param_type(self, param_name, param_value, expected_type):
-        type_checks = {
-            "string": lambda x: isinstance(x, str),
-            "integer": lambda x: isinstance(x, int) or (isinstance(x, str) and x.isdigit()),
-            "number": lambda x: isinstance(x, (int, float)) or (isinstance(x, str) and x.replace('.', '').isdigit()),
-            "boolean": lambda x: isinstance(x, bool) or (isinstance(x, str) and x.lower() in ['true', 'false'])
-        }
-        if expected_type in type_checks and not type_checks[expected_type](param_value):
+        type_check = TYPE_CHECKS.get(expected_type) if isinstance(expected_type, str) else None
+        if type_check is not None and not type_check(param_value):
             raise ValueError(f"Invalid type for parameter '{param_name}'. Expected {expected_type}.")
 
     def _validate_enum(self, param_name, param_value, enum_values):
@@ -197,118 +393,124 @@ class BankAPIMockChecker:
             raise ValueError(f"Invalid value for parameter '{param_name}'. Must be one of: {enum_values}")
 
     def _validate_pattern(self, param_name, param_value, pattern):
-        if pattern and not re.match(pattern, str(param_value)):
+        if not pattern:
+            return
+        compiled = self._compiled_patterns.get(pattern)
+        if compiled is None:
+            compiled = self._compiled_patterns[pattern] = re.compile(pattern)
+        if not compiled.match(str(param_value)):
             raise ValueError(f"Invalid format for parameter '{param_name}'. Must match pattern: {pattern}")
 
     def _generate_mock_response(self, schema, depth=0):
-        logger.debug(f"Generating mock response for schema: {schema}")
-        if depth > self.max_recursion_depth:
-            return "Max recursion depth exceeded"
-
-        if "type" not in schema:
-            if "$ref" in schema:
-                ref_path = schema["$ref"].split("/")
-                ref_schema = self.openapi_spec
-                for path in ref_path[1:]:
-                    ref_schema = ref_schema[path]
-                return self._generate_mock_response(ref_schema, depth + 1)
-            return {}
-
-        if schema["type"] == "object":
-            response = {}
-            if "properties" in schema:
-                for prop, prop_schema in schema["properties"].items():
-                    response[prop] = self._generate_mock_response(
-                        prop_schema, depth + 1
-                    )
-            return response
-        elif schema["type"] == "array":
-            items_schema = schema.get("items", {})
-            return [
-                self._generate_mock_response(items_schema, depth + 1)
-                for _ in range(random.randint(1, 3))
-            ]
-        elif schema["type"] == "string":
-            if "enum" in schema:
-                return random.choice(schema["enum"])
-            elif "format" in schema:
-                if schema["format"] == "date-time":
-                    return fake.iso8601()
-                elif schema["format"] == "date":
-                    return fake.date_this_decade().isoformat()
-            return fake.word()
-        elif schema["type"] == "number":
-            return round(random.uniform(0, 100), 2)
-        elif schema["type"] == "integer":
-            return random.randint(0, 100)
-        elif schema["type"] == "boolean":
-            return random.choice([True, False])
-        else:
-            logger.warning(f"Unexpected schema type: {schema['type']}")
-            return {}
+        # Walk the schema with an explicit stack instead of recursing; each
+        # entry fills one slot of an already attached dict or list.
+        root = [None]
+        stack = deque([(root, 0, schema, depth)])
+        while stack:
+            parent, key, schema, depth = stack.pop()
+            if depth > self.max_recursion_depth:
+                parent[key] = "Max recursion depth exceeded"
+                continue
+
+            if "type" not in schema:
+                if "$ref" in schema:
+                    ref_schema = self._resolve_ref(schema)
+                    if ref_schema is schema:
+                        raise KeyError(schema["$ref"])
+                    stack.append((parent, key, ref_schema, depth + 1))
+                else:
+                    parent[key] = {}
+                continue
+
+            schema_type = schema["type"]
+            handler = MOCK_HANDLERS.get(schema_type) if isinstance(schema_type, str) else None
+            if handler is None:
+                logger.warning(f"Unexpected schema type: {schema_type}")
+                parent[key] = {}
+            else:
+                parent[key] = handler(schema, depth, stack)
+        return root[0]
 
 def read_output_dataset(file_path):
     requests = []
-    with open(file_path, 'r') as file:
-        for line in file:
-            data = json.loads(line)
-            for answer in data.get('answers', []):
-                request = {
-                    "api_name": answer.get('api_name', ''),
-                    "url": answer.get('url', ''),
-                    "method": answer.get('method', ''),
-                    "endpoint": answer.get('endpoint', ''),
-                    "params": answer.get('params', {})
-                }
-                requests.append(request)
+    with open(file_path, 'rb') as file:
+        lines = file.read().splitlines()
+    for line in lines:
+        data = json_loads(line)
+        for answer in data.get('answers', []):
+            request = {
+                "api_name": answer.get('api_name', ''),
+                "url": answer.get('url', ''),
+                "method": answer.get('method', ''),
+                "endpoint": answer.get('endpoint', ''),
+                "params": answer.get('params', {})
+            }
+            requests.append(request)
     return requests
 
 def read_openapi_specs(folder_path):
     specs = {}
-    for filename in os.listdir(folder_path):
-        if filename.endswith('.json'):
-            file_path = os.path.join(folder_path, filename)
-            try:
-                with open(file_path, 'r', encoding='utf-8') as file:
-                    spec = json.load(file)
-                    api_name = spec.get('info', {}).get('title', '').replace(' ', '_')
-                    specs[api_name] = file_path
-            except UnicodeDecodeError:
-                logger.warning(f"Unable to read {file_path} with UTF-8 encoding. Trying with ISO-8859-1.")
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.endswith('.json'):
                 try:
-                    with open(file_path, 'r', encoding='iso-8859-1') as file:
-                        spec = json.load(file)
-                        api_name = spec.get('info', {}).get('title', '').replace(' ', '_')
-                        specs[api_name] = file_path
+                    spec = _load_json_file(entry.path)
                 except Exception as e:
-                    logger.error(f"Failed to read {file_path}: {str(e)}")
+                    logger.error(f"Failed to read {entry.path}: {str(e)}")
+                    continue
+                api_name = spec.get('info', {}).get('title', '').replace(' ', '_')
+                specs[api_name] = entry.path
     return specs
 
-def match_and_execute_requests(requests, specs):
-    results = []
-    for request in requests:
+def _execute_spec_requests(spec_path, requests):
+    try:
+        checker = BankAPIMockChecker(spec_path)
+    except Exception as e:
+        logger.error(f"Failed to load OpenAPI spec {spec_path}: {e!r}")
+        logger.debug("BankAPIMockChecker traceback", exc_info=True)
+        return [
+            {"status_code": 500, "data": {"error": "Internal server error"}}
+            for _ in requests
+        ]
+    return [
+        checker.mock_execute_request(
+            request['api_name'],
+            request['url'],
+            request['method'],
+            request['endpoint'],
+            request['params']
+        )
+        for request in requests
+    ]
+
+def match_and_execute_requests(requests, specs, max_workers=None):
+    results = [None] * len(requests)
+    batches = {}
+    for index, request in enumerate(requests):
         api_name = request['api_name']
         if api_name in specs:
-            spec_path = specs[api_name]
-            checker = BankAPIMockChecker(spec_path)
-            response = checker.mock_execute_request(
-                api_name,
-                request['url'],
-                request['method'],
-                request['endpoint'],
-                request['params']
-            )
-            results.append({
-                'request': request,
-                'response': response,
-                'spec_file': spec_path
-            })
+            batches.setdefault(specs[api_name], []).append(index)
         else:
-            results.append({
+            results[index] = {
                 'request': request,
                 'error': f"No matching OpenAPI spec found for {api_name}",
                 'spec_file': None
-            })
+            }
+
+    if batches:
+        # Requests are grouped per spec file so every worker builds a single
+        # checker for its batch; results are written back in input order.
+        spec_paths = list(batches)
+        request_batches = [[requests[index] for index in batches[spec_path]] for spec_path in spec_paths]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            batch_responses = executor.map(_execute_spec_requests, spec_paths, request_batches)
+            for spec_path, responses in zip(spec_paths, batch_responses):
+                for index, response in zip(batches[spec_path], responses):
+                    results[index] = {
+                        'request': requests[index],
+                        'response': response,
+                        'spec_file': spec_path
+                    }
     return results
 def main():
     try:
@@ -322,16 +524,19 @@ def main():
         results = match_and_execute_requests(requests, specs)
 
         status_code_summary = {}
+        log_payloads = logger.isEnabledFor(logging.DEBUG)
 
         for i, result in enumerate(results, start=1):
             logger.info(f"Result for request {i}:")
-            logger.info(f"Request: {json.dumps(result['request'], indent=2)}")
+            if log_payloads:
+                logger.debug(f"Request: {json_dumps(result['request'], indent=True)}")
             if 'response' in result:
                 response_code = result['response']['status_code']
                 status_code_summary[response_code] = status_code_summary.get(response_code, 0) + 1
                 
                 logger.info(f"Response status code: {response_code}")
-                logger.info(f"Response data: {json.dumps(result['response']['data'], indent=2)}")
+                if log_payloads:
+                    logger.debug(f"Response data: {json_dumps(result['response']['data'], indent=True)}")
             else:
                 logger.info(f"Error: {result['error']}")
             
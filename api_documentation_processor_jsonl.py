@@ -1,6 +1,6 @@
 import os
 import json
-from collections import defaultdict
+from collections import Counter
 from langchain.chains import LLMChain
 from langchain.prompts.chat import (
     ChatPromptTemplate,
@@ -9,13 +9,14 @@ from langchain.prompts.chat import (
 )
 from gen_ai_hub.proxy.langchain.openai import ChatOpenAI
 from gen_ai_hub.proxy.core.proxy_clients import get_proxy_client
+from json_compat import json_loads, json_dumps
 
 def process_file(file_path, chain):
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            content = json.load(file)
+        with open(file_path, 'rb') as file:
+            content = json_loads(file.read())
         
-        content_str = json.dumps(content, indent=2)
+        content_str = json_dumps(content, indent=True)
         print(f"Content of {file_path}:\n{content_str[:300]}...")
         
         func_name = content.get('name', 'Unknown Function')
@@ -86,7 +87,7 @@ def process_file(file_path, chain):
         response = chain.invoke(prompt)
         
         try:
-            result = json.loads(response['text'])
+            result = json_loads(response['text'])
             
             for entry in result:
                 entry['file'] = os.path.basename(file_path)
@@ -99,25 +100,31 @@ def process_file(file_path, chain):
         print(f"Error processing file {file_path}: {str(e)}")
         return None
 
+def _params_key(params):
+    if isinstance(params, dict):
+        return tuple(params)
+    return tuple(range(len(params)))
+
 def analyze_queries(jsonl_data):
-    unique_structures = defaultdict(int)
-    batch_requests = defaultdict(int)
+    unique_structures = Counter()
+    batch_requests = Counter()
     single_requests = 0
 
     for entry in jsonl_data:
+        answers = entry['answers']
         structure_key = tuple(
             (
                 answer['api_name'],
                 answer['url'],
                 answer['method'],
                 answer['endpoint'],
-                tuple(answer.get('params', {}).keys() if isinstance(answer.get('params', {}), dict) else range(len(answer.get('params', []))))
-            ) for answer in entry['answers']
+                _params_key(answer.get('params', {}))
+            ) for answer in answers
         )
         unique_structures[structure_key] += 1
 
-        num_calls = len(entry['answers'])
-        if (num_calls > 1):
+        num_calls = len(answers)
+        if num_calls > 1:
             batch_requests[num_calls] += 1
         else:
             single_requests += 1
@@ -194,7 +201,7 @@ def main():
             jsonl_data.extend(result)
             
             print(f"Completed processing {filename}")
-            print(f"Generated result: {json.dumps(result, indent=2)[:300]}...")
+            print(f"Generated result: {json_dumps(result, indent=True)[:300]}...")
         else:
             print(f"Failed to process {filename}")
         
@@ -203,7 +210,7 @@ def main():
     jsonl_file_path = os.path.join(folder_path, "output_dataset.jsonl")
     with open(jsonl_file_path, "w", encoding='utf-8') as jsonl_file:
         for entry in jsonl_data:
-            jsonl_file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            jsonl_file.write(json_dumps(entry) + "\n")
     
     print(f"Results saved to {jsonl_file_path}")
     
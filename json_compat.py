@@ -0,0 +1,14 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def json_loads(data):
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def json_dumps(obj, indent=False):
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)